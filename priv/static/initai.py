@@ -5,18 +5,55 @@ Initialize LLM frameworks quickly and consistently
 """
 
 import argparse
+import contextlib
 import json
 import os
 import platform
 import shutil
-import subprocess
 import sys
-import tempfile
-import zipfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-import urllib.request
-import urllib.error
+import urllib.parse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize JSON to UTF-8 bytes with 2-space indentation, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def run_in_background(fn):
+    """Call fn on a daemon thread and return a Future for its result
+
+    Daemon threads never hold up interpreter exit, so a prefetch that is no
+    longer needed (e.g. after a script update) does not delay sys.exit().
+    """
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def worker():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
 
 
 class Colors:
@@ -29,13 +66,254 @@ class Colors:
     GRAY = '\033[90m'
     WHITE = '\033[97m'
     RESET = '\033[0m'
+    RESET_NL = RESET + '\n'
+
+    # Skip escape codes when output is redirected or NO_COLOR is set (https://no-color.org)
+    ENABLED = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+    @staticmethod
+    def colorize(message, color):
+        return color + message + Colors.RESET if Colors.ENABLED else message
 
     @staticmethod
     def print_colored(message, color):
-        print(f"{color}{message}{Colors.RESET}")
+        if Colors.ENABLED:
+            sys.stdout.write(color + message + Colors.RESET_NL)
+        else:
+            sys.stdout.write(message + '\n')
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections reused across requests to the same host"""
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    MAX_REDIRECTS = 5
+
+    def __init__(self, ssl_context=None, maxsize=4, user_agent=None):
+        self.ssl_context = ssl_context
+        self.maxsize = maxsize
+        self.user_agent = user_agent or "Python-urllib/%d.%d" % sys.version_info[:2]
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme, netloc):
+        import http.client
+        import urllib.request
+
+        # Honor http_proxy/https_proxy like urllib.request does
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and urllib.request.proxy_bypass(netloc.split(':')[0]):
+            proxy = None
+
+        proxy_headers = {}
+        if proxy:
+            # Proxies are often given without a scheme, e.g. "proxy:3128"
+            proxy_parts = urllib.parse.urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+            host, port = proxy_parts.hostname, proxy_parts.port
+            if proxy_parts.username is not None:
+                import base64
+                credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+                proxy_headers['Proxy-Authorization'] = "Basic " + base64.b64encode(credentials.encode()).decode('ascii')
+        else:
+            host, port = netloc, None
+
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, context=self.ssl_context)
+            if proxy:
+                conn.set_tunnel(netloc, headers=proxy_headers)
+            proxy_headers = {}
+        elif scheme == 'http':
+            conn = http.client.HTTPConnection(host, port)
+        else:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+
+        # Plain HTTP through a proxy needs the absolute URL as request target
+        # and the proxy credentials on every request
+        conn.absolute_target = bool(proxy) and scheme == 'http'
+        conn.proxy_headers = proxy_headers
+        return conn
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _checkin(self, key, conn, response):
+        # A connection can only be reused once its response is fully read
+        if response.isclosed():
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.maxsize:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _send(self, url, headers):
+        import http.client
+
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or '/'
+        if parts.query:
+            target += f"?{parts.query}"
+
+        while True:
+            conn, reused = self._checkout(key)
+            try:
+                conn.request('GET', url if conn.absolute_target else target, headers={**headers, **conn.proxy_headers})
+                return key, conn, conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # The server may have dropped an idle keep-alive connection; retry on a fresh one
+                if not reused:
+                    raise
+
+    @contextlib.contextmanager
+    def open(self, url, headers=None):
+        """GET a URL, following redirects; yields the http.client response"""
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', self.user_agent)
+        # Imported here, not at module level: urllib.error pulls in urllib.response and tempfile
+        import urllib.error
+        for _ in range(self.MAX_REDIRECTS + 1):
+            key, conn, response = self._send(url, headers)
+            location = response.getheader('Location')
+            if response.status not in self.REDIRECT_CODES or not location:
+                break
+            response.read()
+            self._checkin(key, conn, response)
+            url = urllib.parse.urljoin(url, location)
+        else:
+            # Every response so far was a redirect and has already been checked in
+            raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+        try:
+            if response.status >= 400:
+                response.read()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        finally:
+            self._checkin(key, conn, response)
+
+
+CLAUDE_TEMPLATE = """# Claude Instructions for {framework} ({scope})
+
+## Project Context Management
+- **Always save project context and notes to PROJECT.md**
+- CLAUDE.md contains only initialization instructions (don't modify)
+- Use PROJECT.md for ongoing project documentation, decisions, and context
+- Load PROJECT.md content at start of each session to continue where you left off
+
+## Communication Style
+- Use bullet points for all responses
+- Be concise and direct
+- Focus on actionable information
+
+## Project Setup
+- Framework: {framework}
+- Scope: {scope}
+- LLM specialization: {preferred_llm}
+- Reference files: {target_dir} (READ ONLY - do not modify or generate files here)
+
+## Instructions
+Read the framework guidelines from {target_dir} at session start, but work in the main project directory:
+
+- **Read** framework configuration from {target_dir} (reference only)
+- **Apply** coding standards and patterns to your main project files
+- **Use** provided templates as reference for new files in main directory
+- **Load PROJECT.md** to understand current project state
+- **Work in the main project directory** - NOT in the {target_dir} folder
+
+## File Structure
+- CLAUDE.md - Initialization instructions (static - don't modify)
+- PROJECT.md - Your working context (dynamic - update regularly)
+- {target_dir}/ - **READ-ONLY** framework reference files and templates
+- Your actual project files - **Work here** (main directory and subdirectories)
+
+## Key Guidelines
+- Always use bullet format for responses
+- Prioritize developer productivity
+- Follow the framework's best practices from {target_dir} reference
+- Maintain consistency across the project
+- **Save all project decisions and context to PROJECT.md**
+- **IMPORTANT: Generate project files in main directory, NOT in {target_dir}**
+
+---
+Generated by initai.dev on {timestamp}"""
+
+GEMINI_TEMPLATE = """# Gemini Instructions for {framework} ({scope})
+
+## Communication Style
+- Use bullet points for all responses
+- Provide detailed explanations when needed
+- Focus on research and analysis
+
+## Project Setup
+- Framework: {framework}
+- Scope: {scope}
+- LLM specialization: {preferred_llm}
+- Reference files: {target_dir} (READ ONLY - do not modify or generate files here)
+
+## Instructions
+Read the framework guidelines from {target_dir} at session start, but work in the main project directory:
+
+- **Read** framework configuration from {target_dir} (reference only)
+- **Apply** coding standards and patterns to your main project files
+- **Use** provided templates as reference for new files in main directory
+- **Work in the main project directory** - NOT in the {target_dir} folder
+
+## Key Guidelines
+- Always use bullet format for responses
+- Leverage analytical capabilities for complex problems
+- Follow the framework's best practices from {target_dir} reference
+- Provide comprehensive documentation
+- **IMPORTANT: Generate project files in main directory, NOT in {target_dir}**
+
+---
+Generated by initai.dev on {timestamp}"""
+
+UNIVERSAL_TEMPLATE = """# LLM Instructions for {framework} ({scope})
+
+## Communication Style
+- Use bullet points for all responses
+- Adapt to the specific LLM being used
+- Focus on clear, actionable guidance
+
+## Project Setup
+- Framework: {framework}
+- Scope: {scope}
+- LLM specialization: {preferred_llm}
+- Initialization files: {target_dir}
+
+## Instructions
+Please read and follow the initialization files in {target_dir} on every session start:
+
+- Load the framework configuration
+- Apply the coding standards and patterns
+- Use the provided templates and conventions
+
+## Key Guidelines
+- Always use bullet format for responses
+- Work with any LLM provider
+- Follow the framework's best practices
+- Maintain consistency across the project
+
+---
+Generated by initai.dev on {timestamp}"""
+
+# preferred LLM -> (instruction file, template)
+LLM_TEMPLATES = {
+    "claude": ("CLAUDE.md", CLAUDE_TEMPLATE),
+    "gemini": ("GEMINI.md", GEMINI_TEMPLATE),
+    "universal": ("LLM_INSTRUCTIONS.md", UNIVERSAL_TEMPLATE),
+}
 
 
 class InitAI:
+    UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds
+
     def __init__(self, base_url="https://initai.dev", force=False, verbose=False,
                  ignore_ssl_issues=False, update=False, clear=False, clear_all=False):
         self.base_url = base_url
@@ -48,8 +326,15 @@ class InitAI:
 
         self.config_file = ".initai.json"
         self.initai_dir = "initai"
+        self.config_path = Path(self.config_file)
+        self.initai_path = Path(self.initai_dir)
         self.current_version = "2.1.0"
 
+        # One timestamp per invocation, shared by the generated files and the saved config
+        started_at = datetime.now()
+        self.date_str = started_at.strftime("%Y-%m-%d")
+        self.iso_str = started_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+
         # Platform-specific paths
         if platform.system() == "Windows":
             self.app_data_path = Path(os.environ.get("LOCALAPPDATA", "")) / "initai"
@@ -60,6 +345,27 @@ class InitAI:
 
         self.installed_script_path = self.app_data_path / "install.py"
         self.version_file = self.app_data_path / ".initai-version"
+        self.update_check_file = self.app_data_path / ".last-update-check"
+        self.catalog_cache_file = self.app_data_path / "catalog.json"
+        self.catalog_meta_file = self.app_data_path / "catalog.meta"
+
+        # Framework name -> scopes -> variants, built by index_frameworks()
+        self._fw_index = {}
+
+        # Build the unverified SSL context once - loading the trust store is slow
+        if self.ignore_ssl_issues:
+            import ssl
+            self.ssl_context = ssl.create_default_context()
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        else:
+            self.ssl_context = None
+
+        # Reuse one connection (and TLS session) for all requests to the same host
+        self.http = ConnectionPool(
+            ssl_context=self.ssl_context,
+            user_agent=f"initai.py/{self.current_version} Python-urllib/%d.%d" % sys.version_info[:2],
+        )
 
     def write_header(self):
         Colors.print_colored(f"initai.dev - LLM Framework Manager v{self.current_version}", Colors.CYAN)
@@ -98,36 +404,55 @@ class InitAI:
             Colors.print_colored(f"Created app data directory: {self.app_data_path}", Colors.GREEN)
 
     def http_request(self, url, use_json=False):
-        """Make HTTP request with optional SSL bypass"""
+        """Make HTTP request over a pooled connection with optional SSL bypass"""
         try:
-            if self.ignore_ssl_issues:
-                import ssl
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            else:
-                ssl_context = None
-
-            req = urllib.request.Request(url)
-
-            if ssl_context:
-                response = urllib.request.urlopen(req, context=ssl_context)
-            else:
-                response = urllib.request.urlopen(req)
+            with self.http.open(url) as response:
+                body = response.read()
 
             if use_json:
-                return json.loads(response.read().decode('utf-8'))
+                return json_loads(body)
             else:
-                return response.read()
+                return body
         except Exception as e:
             raise Exception(f"HTTP request failed: {e}")
 
-    def test_script_update(self):
+    def http_download(self, url, path):
+        """Stream an HTTP response body to a file over a pooled connection"""
+        with self.http.open(url) as response, open(path, 'wb') as f:
+            shutil.copyfileobj(response, f, 1 << 16)
+
+    def _check_update_raw(self):
+        update_url = f"{self.base_url}/api/check-updates?client_version={self.current_version}&script=python"
+        return self.http_request(update_url, use_json=True)
+
+    def update_check_due(self):
+        """Updates are checked at most once per UPDATE_CHECK_INTERVAL unless --update is passed"""
+        if self.update:
+            return True
+
+        try:
+            last_check = self.update_check_file.stat().st_mtime
+        except OSError:
+            return True
+        return time.time() - last_check >= self.UPDATE_CHECK_INTERVAL
+
+    def mark_update_checked(self):
+        try:
+            self.app_data_path.mkdir(parents=True, exist_ok=True)
+            self.update_check_file.touch()
+        except OSError as e:
+            self.write_verbose_message(f"WARNING: Could not record update check: {e}", Colors.YELLOW)
+
+    def test_script_update(self, pending=None):
+        if not self.update_check_due():
+            self.write_verbose_message("Skipping update check (already checked in the last 24 hours)", Colors.GRAY)
+            return False
+
         self.write_verbose_message("Checking for script updates...", Colors.CYAN)
 
         try:
-            update_url = f"{self.base_url}/api/check-updates?client_version={self.current_version}&script=python"
-            response = self.http_request(update_url, use_json=True)
+            response = pending.result() if pending else self._check_update_raw()
+            self.mark_update_checked()
 
             if response.get('update_available'):
                 Colors.print_colored(f"Update available: v{response.get('current_version')}", Colors.YELLOW)
@@ -159,60 +484,195 @@ class InitAI:
     def update_script(self, update_info):
         self.write_verbose_message("Downloading script update...", Colors.YELLOW)
 
+        current_script = Path(__file__)
+        backup_script = None
+
         try:
             # Download new initai.py script
             download_url = f"{self.base_url}/initai.py"
-            current_script = Path(__file__)
             temp_script = current_script.with_suffix('.new')
 
-            urllib.request.urlretrieve(download_url, temp_script)
+            self.http_download(download_url, temp_script)
 
-            # Backup current script
+            # Backup current script - a hardlink copies no data, fall back to a copy
+            # where links are unsupported (e.g. FAT volumes)
             if current_script.exists():
                 backup_script = current_script.with_suffix('.backup')
-                shutil.copy2(current_script, backup_script)
+                if backup_script.exists():
+                    backup_script.unlink()
+                try:
+                    os.link(str(current_script), str(backup_script))
+                except OSError:
+                    shutil.copy2(current_script, backup_script)
 
-            # Replace current script
-            shutil.move(temp_script, current_script)
+            # Replace current script with an atomic rename
+            os.replace(str(temp_script), str(current_script))
 
-            Colors.print_colored(f"Script updated to v{update_info.get('current_version')}", Colors.GREEN)
-            print()
-            Colors.print_colored("Please restart initai.py to use the new version:", Colors.BLUE)
-            Colors.print_colored("  python initai.py", Colors.YELLOW)
-            print()
-
-            sys.exit(0)
         except Exception as e:
             Colors.print_colored(f"ERROR: Failed to update script: {e}", Colors.RED)
-            backup_script = Path(__file__).with_suffix('.backup')
-            if backup_script.exists():
-                shutil.move(backup_script, Path(__file__))
+            if backup_script and backup_script.exists():
+                os.replace(str(backup_script), str(current_script))
                 Colors.print_colored("Restored backup script", Colors.YELLOW)
             raise
 
+        # The update is in place; the sidecar refresh must not roll it back
+        self.update_checksum_file(current_script)
+
+        Colors.print_colored(f"Script updated to v{update_info.get('current_version')}", Colors.GREEN)
+        print()
+        Colors.print_colored("Please restart initai.py to use the new version:", Colors.BLUE)
+        Colors.print_colored("  python initai.py", Colors.YELLOW)
+        print()
+
+        sys.exit(0)
+
+    def update_checksum_file(self, script):
+        """Keep the installer's SHA-256 sidecar in step with an updated script (best effort)"""
+        checksum_file = script.with_name(script.name + ".sha256")
+        if not checksum_file.exists():
+            return
+
+        temp_file = checksum_file.with_name(checksum_file.name + ".new")
+        try:
+            import hashlib
+            digest = hashlib.sha256(script.read_bytes()).hexdigest()
+            temp_file.write_text(f"{digest}  {script.name}\n")
+            os.replace(str(temp_file), str(checksum_file))
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                temp_file.unlink()
+            self.write_verbose_message(f"WARNING: Could not update checksum file: {e}", Colors.YELLOW)
+
     def test_configuration(self):
-        config_path = Path(self.config_file)
-        if config_path.exists() and not self.force:
+        if self.config_path.exists() and not self.force:
             self.write_verbose_message("Found existing configuration", Colors.GREEN)
             return True
         else:
             Colors.print_colored("Setting up new configuration...", Colors.YELLOW)
             return False
 
-    def get_available_packages(self):
+    def _list_frameworks_raw(self, revalidate=True):
+        """Fetch the catalog; returns (body, etag), with body None when the cached copy is current"""
+        packages_url = f"{self.base_url}/init/shared/list"
+
+        # Revalidate the cached catalog so an unchanged list comes back as an empty 304
+        headers = {}
+        etag = self.read_catalog_etag(packages_url) if revalidate else None
+        if etag:
+            headers['If-None-Match'] = etag
+
+        try:
+            with self.http.open(packages_url, headers) as response:
+                body = response.read()
+                etag = response.getheader('ETag')
+                not_modified = response.status == 304
+        except Exception as e:
+            raise Exception(f"HTTP request failed: {e}")
+
+        return (None if not_modified else body), etag
+
+    def read_catalog_etag(self, url):
+        """Return the cached catalog's ETag if the cache was fetched from url"""
+        if not self.catalog_cache_file.exists():
+            return None
+        try:
+            meta = json_loads(self.catalog_meta_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return meta.get('etag') if meta.get('url') == url else None
+
+    def drop_catalog_meta(self):
+        with contextlib.suppress(FileNotFoundError):
+            self.catalog_meta_file.unlink()
+
+    def save_catalog_cache(self, url, body, etag):
+        try:
+            self.app_data_path.mkdir(parents=True, exist_ok=True)
+            self.drop_catalog_meta()
+            self.catalog_cache_file.write_bytes(body)
+            if etag:
+                self.catalog_meta_file.write_bytes(json_dumps({'url': url, 'etag': etag}))
+        except OSError as e:
+            self.write_verbose_message(f"WARNING: Could not cache framework list: {e}", Colors.YELLOW)
+
+    def get_available_packages(self, pending=None):
         packages_url = f"{self.base_url}/init/shared/list"
         self.write_verbose_message(f"Getting available frameworks from {packages_url}...", Colors.CYAN)
 
         try:
-            response = self.http_request(packages_url, use_json=True)
+            body, etag = pending.result() if pending else self._list_frameworks_raw()
+            # Cache writes (and their warnings) happen here, never on the prefetch thread
+            if body is None:
+                try:
+                    response = json_loads(self.catalog_cache_file.read_bytes())
+                except (OSError, ValueError) as e:
+                    # Otherwise every later run would get a 304 for the damaged copy
+                    self.write_verbose_message(f"WARNING: Cached framework list is unreadable ({e}), downloading it again", Colors.YELLOW)
+                    self.drop_catalog_meta()
+                    body, etag = self._list_frameworks_raw(revalidate=False)
+            if body is not None:
+                self.save_catalog_cache(packages_url, body, etag)
+                response = json_loads(body)
             frameworks = response.get('frameworks', [])
             self.write_verbose_message(f"Found {len(frameworks)} available frameworks", Colors.GREEN)
+            self.index_frameworks(frameworks)
             return frameworks
         except Exception as e:
             Colors.print_colored(f"ERROR: Failed to get frameworks from {packages_url}", Colors.RED)
             Colors.print_colored(str(e), Colors.RED)
             sys.exit(1)
 
+    def index_frameworks(self, frameworks):
+        """Index frameworks -> scopes -> variants by name so selections are dict lookups"""
+        self._fw_index = {
+            framework.get('name'): {
+                'obj': framework,
+                'scopes': {
+                    scope.get('name'): {
+                        'obj': scope,
+                        'variants': {variant.get('name'): variant for variant in scope.get('variants', [])}
+                    }
+                    for scope in framework.get('scopes', [])
+                }
+            }
+            for framework in frameworks
+        }
+
+    def lookup_framework(self, selected_framework):
+        entry = self._fw_index.get(selected_framework)
+        if not entry:
+            Colors.print_colored(f"ERROR: Framework '{selected_framework}' not found", Colors.RED)
+            sys.exit(1)
+        return entry
+
+    def lookup_scope(self, selected_framework, selected_scope):
+        entry = self.lookup_framework(selected_framework)['scopes'].get(selected_scope)
+        if not entry:
+            Colors.print_colored(f"ERROR: Scope '{selected_scope}' not found for {selected_framework}", Colors.RED)
+            sys.exit(1)
+        return entry
+
+    def show_menu(self, entries):
+        """Render numbered (label, detail) menu entries with a single stdout write"""
+        lines = []
+        for i, (label, detail) in enumerate(entries):
+            lines.append(Colors.colorize(f"  {i + 1}) {label}", Colors.CYAN))
+            if detail is not None:
+                lines.append(f"     {detail}")
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+
+    def prompt_choice(self, label, count):
+        """Prompt until a number between 1 and count is entered; returns the zero-based index"""
+        while True:
+            try:
+                selection_num = int(input(f"\nSelect {label} (1-{count}): ").strip())
+                if 1 <= selection_num <= count:
+                    return selection_num - 1
+                print("Invalid selection. Please try again.")
+            except ValueError:
+                print("Please enter a valid number.")
+
     def select_framework(self, frameworks):
         if not frameworks:
             Colors.print_colored("ERROR: No frameworks available", Colors.RED)
@@ -221,26 +681,12 @@ class InitAI:
         print()
         Colors.print_colored("Which framework would you like to use?", Colors.BLUE)
 
-        for i, framework in enumerate(frameworks):
-            Colors.print_colored(f"  {i + 1}) {framework.get('name')}", Colors.CYAN)
-            print(f"     {framework.get('description', '')}")
+        self.show_menu((framework.get('name'), framework.get('description', '')) for framework in frameworks)
 
-        while True:
-            try:
-                selection = input(f"\nSelect framework (1-{len(frameworks)}): ").strip()
-                selection_num = int(selection)
-                if 1 <= selection_num <= len(frameworks):
-                    return frameworks[selection_num - 1].get('name')
-                else:
-                    print("Invalid selection. Please try again.")
-            except ValueError:
-                print("Please enter a valid number.")
+        return frameworks[self.prompt_choice("framework", len(frameworks))].get('name')
 
-    def select_scope(self, frameworks, selected_framework):
-        framework = next((f for f in frameworks if f.get('name') == selected_framework), None)
-        if not framework:
-            Colors.print_colored(f"ERROR: Framework '{selected_framework}' not found", Colors.RED)
-            sys.exit(1)
+    def select_scope(self, selected_framework):
+        framework = self.lookup_framework(selected_framework)['obj']
 
         scopes = framework.get('scopes', [])
         if not scopes:
@@ -256,32 +702,15 @@ class InitAI:
             "fullstack": "Fullstack - Complete application development"
         }
 
-        for i, scope in enumerate(scopes):
-            scope_name = scope.get('name')
-            description = scope_descriptions.get(scope_name, f"{scope_name} - {scope.get('description', '')}")
-            Colors.print_colored(f"  {i + 1}) {description}", Colors.CYAN)
-
-        while True:
-            try:
-                selection = input(f"\nSelect scope (1-{len(scopes)}): ").strip()
-                selection_num = int(selection)
-                if 1 <= selection_num <= len(scopes):
-                    return scopes[selection_num - 1].get('name')
-                else:
-                    print("Invalid selection. Please try again.")
-            except ValueError:
-                print("Please enter a valid number.")
+        self.show_menu(
+            (scope_descriptions.get(scope.get('name'), f"{scope.get('name')} - {scope.get('description', '')}"), None)
+            for scope in scopes
+        )
 
-    def select_llm(self, frameworks, selected_framework, selected_scope):
-        framework = next((f for f in frameworks if f.get('name') == selected_framework), None)
-        if not framework:
-            Colors.print_colored(f"ERROR: Framework '{selected_framework}' not found", Colors.RED)
-            sys.exit(1)
+        return scopes[self.prompt_choice("scope", len(scopes))].get('name')
 
-        scope = next((s for s in framework.get('scopes', []) if s.get('name') == selected_scope), None)
-        if not scope:
-            Colors.print_colored(f"ERROR: Scope '{selected_scope}' not found for {selected_framework}", Colors.RED)
-            sys.exit(1)
+    def select_llm(self, selected_framework, selected_scope):
+        scope = self.lookup_scope(selected_framework, selected_scope)['obj']
 
         variants = scope.get('variants', [])
         if not variants:
@@ -297,37 +726,20 @@ class InitAI:
             "universal": lambda v: f"Universal - {v.get('description', '')}"
         }
 
-        for i, variant in enumerate(variants):
+        menu = []
+        for variant in variants:
             variant_name = variant.get('name')
             if variant_name in llm_descriptions:
                 description = llm_descriptions[variant_name](variant)
             else:
                 description = f"{variant_name} - {variant.get('description', '')}"
-            Colors.print_colored(f"  {i + 1}) {description}", Colors.CYAN)
-
-        while True:
-            try:
-                selection = input(f"\nSelect LLM (1-{len(variants)}): ").strip()
-                selection_num = int(selection)
-                if 1 <= selection_num <= len(variants):
-                    return variants[selection_num - 1].get('name')
-                else:
-                    print("Invalid selection. Please try again.")
-            except ValueError:
-                print("Please enter a valid number.")
+            menu.append((description, None))
+        self.show_menu(menu)
 
-    def find_download_url(self, frameworks, selected_framework, selected_scope, selected_llm):
-        framework = next((f for f in frameworks if f.get('name') == selected_framework), None)
-        if not framework:
-            Colors.print_colored(f"ERROR: Framework '{selected_framework}' not found", Colors.RED)
-            sys.exit(1)
+        return variants[self.prompt_choice("LLM", len(variants))].get('name')
 
-        scope = next((s for s in framework.get('scopes', []) if s.get('name') == selected_scope), None)
-        if not scope:
-            Colors.print_colored(f"ERROR: Scope '{selected_scope}' not found for {selected_framework}", Colors.RED)
-            sys.exit(1)
-
-        variant = next((v for v in scope.get('variants', []) if v.get('name') == selected_llm), None)
+    def find_download_url(self, selected_framework, selected_scope, selected_llm):
+        variant = self.lookup_scope(selected_framework, selected_scope)['variants'].get(selected_llm)
         if not variant:
             Colors.print_colored(f"ERROR: LLM variant '{selected_llm}' not found for {selected_framework}/{selected_scope}", Colors.RED)
             sys.exit(1)
@@ -335,7 +747,7 @@ class InitAI:
         return variant.get('download_url')
 
     def download_package(self, framework, scope, llm, download_url):
-        target_dir = Path(self.initai_dir) / f"{framework}-{scope}-{llm}"
+        target_dir = self.initai_path / f"{framework}-{scope}-{llm}"
         print()
         self.write_verbose_message(f"Downloading {framework} ({scope}) package for {llm}...", Colors.YELLOW)
 
@@ -343,17 +755,21 @@ class InitAI:
 
         try:
             full_download_url = f"{self.base_url}{download_url}"
-            zip_file = target_dir / "package.zip"
 
+            # Buffer the archive in memory (spilling to a temp file only if large)
+            # instead of writing package.zip next to the extracted files
             self.write_verbose_message(f"  Downloading from {full_download_url}...", Colors.CYAN)
-            urllib.request.urlretrieve(full_download_url, zip_file)
+            import tempfile
+            import zipfile
 
-            self.write_verbose_message("  Extracting package...", Colors.CYAN)
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                zip_ref.extractall(target_dir)
+            with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as buffer:
+                with self.http.open(full_download_url) as response:
+                    shutil.copyfileobj(response, buffer, 1 << 16)
+                buffer.seek(0)
 
-            # Remove the zip file
-            zip_file.unlink()
+                self.write_verbose_message("  Extracting package...", Colors.CYAN)
+                with zipfile.ZipFile(buffer, 'r') as zip_ref:
+                    self.extract_package(zip_ref, target_dir)
 
             Colors.print_colored(f"Package downloaded and extracted to: {target_dir}", Colors.GREEN)
             return target_dir
@@ -361,6 +777,24 @@ class InitAI:
             Colors.print_colored(f"ERROR: Failed to download package: {e}", Colors.RED)
             raise
 
+    def extract_package(self, zip_ref, target_dir):
+        """Extract all members with a 1 MiB copy buffer, creating each directory once"""
+        created_dirs = set()
+        for info in zip_ref.infolist():
+            name = os.path.normpath(info.filename)
+            if os.path.isabs(name) or os.path.splitdrive(name)[0] or name.split(os.sep)[0] == '..':
+                raise Exception(f"Unsafe path in package: {info.filename}")
+
+            target = target_dir / name
+            directory = target if info.is_dir() else target.parent
+            if directory not in created_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(directory)
+
+            if not info.is_dir():
+                with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+
     def save_configuration(self, framework, scope, llm, target_dir, launch_claude=None):
         download_url = f"/init/shared/{framework}/{scope}"
         if llm != "universal":
@@ -374,7 +808,7 @@ class InitAI:
             "description": f"{framework} {scope} development for {llm}",
             "download_url": download_url,
             "target_dir": str(target_dir),
-            "last_updated": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "last_updated": self.iso_str,
             "script_version": self.current_version
         }
 
@@ -382,147 +816,64 @@ class InitAI:
         if launch_claude is not None:
             config["launch_claude"] = launch_claude
 
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        self.config_path.write_bytes(json_dumps(config))
         Colors.print_colored(f"Configuration saved to {self.config_file}", Colors.GREEN)
 
     def generate_llm_instructions(self, preferred_llm, framework, scope, target_dir):
-        llm_file = ""
-        content = ""
-
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-
-        if preferred_llm == "claude":
-            llm_file = "CLAUDE.md"
-            content = f"""# Claude Instructions for {framework} ({scope})
-
-## Project Context Management
-- **Always save project context and notes to PROJECT.md**
-- CLAUDE.md contains only initialization instructions (don't modify)
-- Use PROJECT.md for ongoing project documentation, decisions, and context
-- Load PROJECT.md content at start of each session to continue where you left off
-
-## Communication Style
-- Use bullet points for all responses
-- Be concise and direct
-- Focus on actionable information
-
-## Project Setup
-- Framework: {framework}
-- Scope: {scope}
-- LLM specialization: {preferred_llm}
-- Reference files: {target_dir} (READ ONLY - do not modify or generate files here)
-
-## Instructions
-Read the framework guidelines from {target_dir} at session start, but work in the main project directory:
-
-- **Read** framework configuration from {target_dir} (reference only)
-- **Apply** coding standards and patterns to your main project files
-- **Use** provided templates as reference for new files in main directory
-- **Load PROJECT.md** to understand current project state
-- **Work in the main project directory** - NOT in the {target_dir} folder
-
-## File Structure
-- CLAUDE.md - Initialization instructions (static - don't modify)
-- PROJECT.md - Your working context (dynamic - update regularly)
-- {target_dir}/ - **READ-ONLY** framework reference files and templates
-- Your actual project files - **Work here** (main directory and subdirectories)
-
-## Key Guidelines
-- Always use bullet format for responses
-- Prioritize developer productivity
-- Follow the framework's best practices from {target_dir} reference
-- Maintain consistency across the project
-- **Save all project decisions and context to PROJECT.md**
-- **IMPORTANT: Generate project files in main directory, NOT in {target_dir}**
-
----
-Generated by initai.dev on {timestamp}"""
-
-        elif preferred_llm == "gemini":
-            llm_file = "GEMINI.md"
-            content = f"""# Gemini Instructions for {framework} ({scope})
-
-## Communication Style
-- Use bullet points for all responses
-- Provide detailed explanations when needed
-- Focus on research and analysis
-
-## Project Setup
-- Framework: {framework}
-- Scope: {scope}
-- LLM specialization: {preferred_llm}
-- Reference files: {target_dir} (READ ONLY - do not modify or generate files here)
-
-## Instructions
-Read the framework guidelines from {target_dir} at session start, but work in the main project directory:
-
-- **Read** framework configuration from {target_dir} (reference only)
-- **Apply** coding standards and patterns to your main project files
-- **Use** provided templates as reference for new files in main directory
-- **Work in the main project directory** - NOT in the {target_dir} folder
-
-## Key Guidelines
-- Always use bullet format for responses
-- Leverage analytical capabilities for complex problems
-- Follow the framework's best practices from {target_dir} reference
-- Provide comprehensive documentation
-- **IMPORTANT: Generate project files in main directory, NOT in {target_dir}**
-
----
-Generated by initai.dev on {timestamp}"""
-
-        elif preferred_llm == "universal":
-            llm_file = "LLM_INSTRUCTIONS.md"
-            content = f"""# LLM Instructions for {framework} ({scope})
-
-## Communication Style
-- Use bullet points for all responses
-- Adapt to the specific LLM being used
-- Focus on clear, actionable guidance
-
-## Project Setup
-- Framework: {framework}
-- Scope: {scope}
-- LLM specialization: {preferred_llm}
-- Initialization files: {target_dir}
-
-## Instructions
-Please read and follow the initialization files in {target_dir} on every session start:
-
-- Load the framework configuration
-- Apply the coding standards and patterns
-- Use the provided templates and conventions
-
-## Key Guidelines
-- Always use bullet format for responses
-- Work with any LLM provider
-- Follow the framework's best practices
-- Maintain consistency across the project
-
----
-Generated by initai.dev on {timestamp}"""
+        if preferred_llm not in LLM_TEMPLATES:
+            return
 
-        if content:
-            # Check if LLM instruction file already exists
-            llm_path = Path(llm_file)
-            if llm_path.exists():
+        llm_file, template = LLM_TEMPLATES[preferred_llm]
+        content = template.format_map({
+            "framework": framework,
+            "scope": scope,
+            "preferred_llm": preferred_llm,
+            "target_dir": target_dir,
+            "timestamp": self.date_str,
+        })
+
+        # Check if LLM instruction file already exists
+        llm_path = Path(llm_file)
+        if llm_path.exists():
+            print()
+            overwrite = input(f"{llm_file} already exists. Overwrite? (y/n): ").strip()
+            if overwrite.lower() not in ['y', 'yes']:
+                Colors.print_colored(f"Keeping existing {llm_file}", Colors.CYAN)
                 print()
-                overwrite = input(f"{llm_file} already exists. Overwrite? (y/n): ").strip()
-                if overwrite.lower() not in ['y', 'yes']:
-                    Colors.print_colored(f"Keeping existing {llm_file}", Colors.CYAN)
-                    print()
-                    Colors.print_colored("WARNING: Make sure your {llm_file} contains the instruction:", Colors.YELLOW)
-                    Colors.print_colored(f'"Please read and follow the initialization files in {target_dir} on every session start"', Colors.BLUE)
-                    print()
-                    return
+                Colors.print_colored(f"WARNING: Make sure your {llm_file} contains the instruction:", Colors.YELLOW)
+                Colors.print_colored(f'"Please read and follow the initialization files in {target_dir} on every session start"', Colors.BLUE)
+                print()
+                return
 
-            try:
-                with open(llm_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                Colors.print_colored(f"Created {llm_file} with project instructions", Colors.GREEN)
-            except Exception as e:
-                Colors.print_colored(f"WARNING: Could not create {llm_file}: {e}", Colors.YELLOW)
+        try:
+            with open(llm_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            Colors.print_colored(f"Created {llm_file} with project instructions", Colors.GREEN)
+        except Exception as e:
+            Colors.print_colored(f"WARNING: Could not create {llm_file}: {e}", Colors.YELLOW)
+
+    def read_preview(self, path, max_lines):
+        """Return the first max_lines raw lines of a file and whether more content follows"""
+        fd = os.open(str(path), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            # Usually one read: stop once there is at least one byte past the preview lines
+            data = os.read(fd, 8192)
+            while True:
+                parts = data.split(b'\n', max_lines)
+                if len(parts) > max_lines and parts[max_lines]:
+                    break
+                chunk = os.read(fd, 8192)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            os.close(fd)
+
+        has_more = len(parts) > max_lines and bool(parts[max_lines])
+        head = parts[:max_lines]
+        if head and not head[-1] and len(parts) <= max_lines:
+            head.pop()  # trailing newline at end of file, not an empty line
+        return head, has_more
 
     def show_package_instructions(self, target_dir):
         init_file = target_dir / "init.md"
@@ -530,13 +881,13 @@ Generated by initai.dev on {timestamp}"""
             print()
             Colors.print_colored("=== Package Instructions ===", Colors.BLUE)
             try:
-                with open(init_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in lines[:10]:  # Show first 10 lines
-                        Colors.print_colored(line.rstrip(), Colors.WHITE)
+                head, has_more = self.read_preview(init_file, 10)
+
+                for line in head:
+                    Colors.print_colored(line.decode('utf-8', 'replace').rstrip(), Colors.WHITE)
 
-                    if len(lines) > 10:
-                        Colors.print_colored(f"... (see {init_file} for full instructions)", Colors.YELLOW)
+                if has_more:
+                    Colors.print_colored(f"... (see {init_file} for full instructions)", Colors.YELLOW)
             except Exception as e:
                 Colors.print_colored(f"Could not read {init_file}: {e}", Colors.YELLOW)
 
@@ -545,26 +896,24 @@ Generated by initai.dev on {timestamp}"""
     def clear_initai_folder(self):
         Colors.print_colored("Cleaning up initai folder...", Colors.YELLOW)
 
-        initai_path = Path(self.initai_dir)
-        if initai_path.exists():
-            try:
-                shutil.rmtree(initai_path)
-                Colors.print_colored(f"Removed initai folder: {initai_path}", Colors.GREEN)
-            except Exception as e:
-                Colors.print_colored(f"WARNING: Could not remove initai folder: {e}", Colors.YELLOW)
-        else:
+        try:
+            shutil.rmtree(self.initai_path)
+            Colors.print_colored(f"Removed initai folder: {self.initai_path}", Colors.GREEN)
+        except FileNotFoundError:
             Colors.print_colored("No initai folder found to remove", Colors.CYAN)
+        except Exception as e:
+            Colors.print_colored(f"WARNING: Could not remove initai folder: {e}", Colors.YELLOW)
 
         # Also remove LLM instruction files
         llm_files = ["CLAUDE.md", "GEMINI.md", "LLM_INSTRUCTIONS.md"]
         for file in llm_files:
-            file_path = Path(file)
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                    Colors.print_colored(f"Removed LLM instruction file: {file}", Colors.GREEN)
-                except Exception as e:
-                    Colors.print_colored(f"WARNING: Could not remove {file}: {e}", Colors.YELLOW)
+            try:
+                Path(file).unlink()
+                Colors.print_colored(f"Removed LLM instruction file: {file}", Colors.GREEN)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                Colors.print_colored(f"WARNING: Could not remove {file}: {e}", Colors.YELLOW)
 
     def clear_all_local_files(self):
         Colors.print_colored("Cleaning up all local initai files...", Colors.YELLOW)
@@ -573,31 +922,49 @@ Generated by initai.dev on {timestamp}"""
         self.clear_initai_folder()
 
         # Remove local configuration
-        config_path = Path(self.config_file)
-        if config_path.exists():
-            try:
-                config_path.unlink()
-                Colors.print_colored(f"Removed local configuration: {config_path}", Colors.GREEN)
-            except Exception as e:
-                Colors.print_colored(f"WARNING: Could not remove {self.config_file}: {e}", Colors.YELLOW)
-        else:
+        try:
+            self.config_path.unlink()
+            Colors.print_colored(f"Removed local configuration: {self.config_path}", Colors.GREEN)
+        except FileNotFoundError:
             Colors.print_colored("No local configuration found to remove", Colors.CYAN)
+        except Exception as e:
+            Colors.print_colored(f"WARNING: Could not remove {self.config_file}: {e}", Colors.YELLOW)
 
         print()
         Colors.print_colored("Local cleanup complete!", Colors.GREEN)
         Colors.print_colored(f"Note: Global user preferences in {self.global_config_file} are preserved", Colors.BLUE)
 
-    def get_current_configuration(self):
-        config_path = Path(self.config_file)
-        if config_path.exists():
-            try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                Colors.print_colored(f"WARNING: Could not read config: {e}", Colors.YELLOW)
-                return None
+    def find_executable(self, *names):
+        """Return the first of names found on PATH, checking every name per directory in a single walk"""
+        # Candidate file names are worked out once, not per directory as shutil.which would
+        if platform.system() == "Windows":
+            extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").lower().split(os.pathsep)
+            candidates = [
+                (name, [name] if name.lower().endswith(tuple(extensions)) else [name + ext for ext in extensions])
+                for name in names
+            ]
+        else:
+            candidates = [(name, [name]) for name in names]
+
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            if not directory:
+                continue
+            for name, filenames in candidates:
+                for filename in filenames:
+                    path = os.path.join(directory, filename)
+                    if os.path.isfile(path) and os.access(path, os.X_OK):
+                        return name
         return None
 
+    def get_current_configuration(self):
+        try:
+            return json_loads(self.config_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            Colors.print_colored(f"WARNING: Could not read config: {e}", Colors.YELLOW)
+            return None
+
     def run(self):
         self.write_header()
 
@@ -612,18 +979,26 @@ Generated by initai.dev on {timestamp}"""
 
         self.test_dependencies()
 
-        # Always check for script updates
-        if self.test_script_update():
+        # The update check and framework list are independent - fetch them concurrently
+        update_future = None
+        if self.update_check_due():
+            update_future = run_in_background(self._check_update_raw)
+        frameworks_future = None
+        if self.force or not self.config_path.exists():
+            frameworks_future = run_in_background(self._list_frameworks_raw)
+
+        # Check for script updates (at most once a day unless --update is passed)
+        if self.test_script_update(update_future):
             return  # Script was updated, exit current execution
 
         if not self.test_configuration():
             # New setup - ask for framework, scope, then LLM
-            frameworks = self.get_available_packages()
+            frameworks = self.get_available_packages(frameworks_future)
 
             selected_framework = self.select_framework(frameworks)
-            selected_scope = self.select_scope(frameworks, selected_framework)
-            selected_llm = self.select_llm(frameworks, selected_framework, selected_scope)
-            download_url = self.find_download_url(frameworks, selected_framework, selected_scope, selected_llm)
+            selected_scope = self.select_scope(selected_framework)
+            selected_llm = self.select_llm(selected_framework, selected_scope)
+            download_url = self.find_download_url(selected_framework, selected_scope, selected_llm)
 
             print()
             Colors.print_colored(f"Selected: {selected_framework} ({selected_scope}) for {selected_llm}", Colors.BLUE)
@@ -643,10 +1018,13 @@ Generated by initai.dev on {timestamp}"""
                     if launch_claude.lower() in ['y', 'yes']:
                         launch_claude_preference = True
                         try:
-                            if shutil.which("claude-code"):
+                            import subprocess
+
+                            claude_command = self.find_executable("claude-code", "claude")
+                            if claude_command == "claude-code":
                                 Colors.print_colored("Starting Claude Code...", Colors.CYAN)
                                 subprocess.run(["claude-code"])
-                            elif shutil.which("claude"):
+                            elif claude_command == "claude":
                                 Colors.print_colored("Starting Claude CLI...", Colors.CYAN)
                                 subprocess.run(["claude"])
                             else:
@@ -4,14 +4,40 @@ InitAI.dev - Python Bootstrap Installer
 Downloads and sets up the main InitAI script with PATH management
 """
 
-import argparse
+import contextlib
 import os
-import platform
-import subprocess
 import sys
+import time
+import types
 from pathlib import Path
-import urllib.request
-import urllib.error
+import urllib.parse
+
+SMALL_DOWNLOAD_LIMIT = 1 << 20  # bytes; smaller bodies are buffered in memory
+USER_AGENT = "initai.dev-installer Python-urllib/%d.%d" % sys.version_info[:2]
+
+# Installer options that take a value, mapped to their attribute names
+VALUE_OPTIONS = {"--base-url": "base_url", "--filesystem-cache": "filesystem_cache"}
+
+# Platform facts looked up once at startup
+# os.umask can only be read by setting it, so do that before any threads start
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+IS_WINDOWS = sys.platform == "win32"
+# Shell name from $SHELL's basename, e.g. /usr/bin/zsh-5.9 -> zsh
+SHELL_NAME = os.path.basename(os.environ.get("SHELL", "")).split("-")[0]
+
+if SHELL_NAME == "zsh":
+    SHELL_RC = os.path.join(os.environ.get("ZDOTDIR") or os.path.expanduser("~"), ".zshrc")
+else:
+    SHELL_RC = os.path.expanduser("~/.bashrc")
+
+# PATH entries split once; add_to_user_path() records entries it adds
+_PATH_SET = {entry.strip() for entry in os.environ.get("PATH", "").split(os.pathsep) if entry.strip()}
+
+if IS_WINDOWS:
+    APP_DATA_PATH = os.path.join(os.environ.get("LOCALAPPDATA", ""), "initai")
+else:
+    APP_DATA_PATH = os.path.expanduser("~/.local/share/initai")
 
 
 class Colors:
@@ -24,9 +50,263 @@ class Colors:
     WHITE = '\033[97m'
     RESET = '\033[0m'
 
-    @staticmethod
-    def print_colored(message, color):
-        print(f"{color}{message}{Colors.RESET}")
+    # Skip escape codes when output is piped or NO_COLOR is set (https://no-color.org)
+    USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+    @classmethod
+    def print_colored(cls, message, color):
+        print(f"{color}{message}{cls.RESET}" if cls.USE_COLOR else message)
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections reused across requests to the same host"""
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    MAX_REDIRECTS = 5
+    RETRY_STATUSES = (502, 503, 504)
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+
+    def __init__(self, ssl_context=None, maxsize=4, user_agent=None):
+        self.ssl_context = ssl_context
+        self.maxsize = maxsize
+        self.user_agent = user_agent or "Python-urllib/%d.%d" % sys.version_info[:2]
+        self._idle = {}
+        import threading
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme, netloc):
+        import http.client
+        import urllib.request
+
+        # Honor http_proxy/https_proxy like urllib.request does
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and urllib.request.proxy_bypass(netloc.split(':')[0]):
+            proxy = None
+
+        proxy_headers = {}
+        if proxy:
+            # Proxies are often given without a scheme, e.g. "proxy:3128"
+            proxy_parts = urllib.parse.urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+            host, port = proxy_parts.hostname, proxy_parts.port
+            if proxy_parts.username is not None:
+                import base64
+                credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+                proxy_headers['Proxy-Authorization'] = "Basic " + base64.b64encode(credentials.encode()).decode('ascii')
+        else:
+            host, port = netloc, None
+
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, context=self.ssl_context)
+            if proxy:
+                conn.set_tunnel(netloc, headers=proxy_headers)
+            proxy_headers = {}
+        elif scheme == 'http':
+            conn = http.client.HTTPConnection(host, port)
+        else:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+
+        # Plain HTTP through a proxy needs the absolute URL as request target
+        # and the proxy credentials on every request
+        conn.absolute_target = bool(proxy) and scheme == 'http'
+        conn.proxy_headers = proxy_headers
+        return conn
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _checkin(self, key, conn, response):
+        # A connection can only be reused once its response is fully read
+        if response.isclosed():
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.maxsize:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _send(self, url, headers):
+        import http.client
+
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or '/'
+        if parts.query:
+            target += f"?{parts.query}"
+
+        while True:
+            conn, reused = self._checkout(key)
+            try:
+                conn.request('GET', url if conn.absolute_target else target, headers={**headers, **conn.proxy_headers})
+                return key, conn, conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # The server may have dropped an idle keep-alive connection; retry on a fresh one
+                if not reused:
+                    raise
+
+    def _send_retrying(self, url, headers):
+        """_send, retrying transient gateway errors (502/503/504) with exponential backoff"""
+        for attempt in range(self.MAX_RETRIES):
+            key, conn, response = self._send(url, headers)
+            if response.status not in self.RETRY_STATUSES:
+                return key, conn, response
+            response.read()
+            self._checkin(key, conn, response)
+            time.sleep(self.RETRY_BACKOFF * (2 ** attempt))
+        return self._send(url, headers)
+
+    @contextlib.contextmanager
+    def open(self, url, headers=None):
+        """GET a URL, following redirects; yields the http.client response"""
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', self.user_agent)
+        # Imported here, not at module level: urllib.error pulls in urllib.response and tempfile
+        import urllib.error
+        for _ in range(self.MAX_REDIRECTS + 1):
+            key, conn, response = self._send_retrying(url, headers)
+            location = response.getheader('Location')
+            if response.status not in self.REDIRECT_CODES or not location:
+                break
+            response.read()
+            self._checkin(key, conn, response)
+            url = urllib.parse.urljoin(url, location)
+        else:
+            # Every response so far was a redirect and has already been checked in
+            raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+        try:
+            if response.status >= 400:
+                response.read()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        finally:
+            self._checkin(key, conn, response)
+
+
+# Keep-alive connections reused by every download in this process
+_HTTP = None
+
+
+def get_http_pool():
+    """Return the shared ConnectionPool, created on the first download"""
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = ConnectionPool(user_agent=USER_AGENT)
+    return _HTTP
+
+
+@contextlib.contextmanager
+def atomic_write(path):
+    """Write to a temp file beside path and move it into place only once complete"""
+    import tempfile
+    tmp = tempfile.NamedTemporaryFile(
+        dir=str(path.parent), prefix=f".{path.name}.", suffix=".part", delete=False
+    )
+    try:
+        with tmp:
+            yield tmp
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # NamedTemporaryFile creates 0600 files; give the result normal permissions
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, str(path))
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
+
+
+def file_sha256(path):
+    """Return the hex SHA-256 digest of a file"""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_cache_meta(meta_path, url):
+    """Load the ETag/Last-Modified sidecar for a cached download, if it matches the URL"""
+    import json
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if meta.get("url") == url else {}
+
+
+def download_file(url, path, cache_dir=None):
+    """Download a URL to a file, revalidating a cached copy with ETag/Last-Modified
+
+    The cached copy is the target file itself unless cache_dir is given.
+    Returns False when the server reported the cached copy as current.
+    """
+    import gzip
+    import hashlib
+    import json
+    import shutil
+
+    path = Path(path)
+    cached_path = Path(cache_dir) / path.name if cache_dir else path
+    meta_path = cached_path.with_name(cached_path.name + ".meta")
+
+    # Scripts are text and compress well
+    headers = {"Accept-Encoding": "gzip"}
+    meta = read_cache_meta(meta_path, url) if cached_path.exists() else {}
+    # Only revalidate a cached copy that is byte-for-byte what was downloaded
+    if meta and meta.get("sha256") != file_sha256(cached_path):
+        meta = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    digest = None
+    with get_http_pool().open(url, headers) as response:
+        modified = response.status != 304
+        if modified:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            # Drop the old sidecar first so an interrupted download is never trusted
+            if meta_path.exists():
+                meta_path.unlink()
+            gzipped = (response.getheader("Content-Encoding") or "").lower() == "gzip"
+            length = response.getheader("Content-Length")
+            if length and length.isdigit() and int(length) < SMALL_DOWNLOAD_LIMIT:
+                # Small payloads are read in one go and written with a single call
+                data = response.read()
+                if gzipped:
+                    data = gzip.decompress(data)
+                digest = hashlib.sha256(data).hexdigest()
+                with atomic_write(cached_path) as f:
+                    f.write(data)
+            else:
+                body = gzip.GzipFile(fileobj=response) if gzipped else response
+                with atomic_write(cached_path) as f:
+                    shutil.copyfileobj(body, f, 1 << 20)
+            meta = {
+                "url": url,
+                "etag": response.getheader("ETag"),
+                "last_modified": response.getheader("Last-Modified"),
+            }
+        else:
+            response.read()
+
+    if modified and (meta["etag"] or meta["last_modified"]):
+        meta["sha256"] = digest or file_sha256(cached_path)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    if cached_path != path:
+        with open(cached_path, "rb") as src, atomic_write(path) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+    return modified
 
 
 def write_header():
@@ -45,62 +325,79 @@ def write_verbose_message(message, color=None, verbose=False):
 
 def get_app_data_path():
     """Get platform-specific app data path"""
-    if platform.system() == "Windows":
-        return os.path.join(os.environ.get("LOCALAPPDATA", ""), "initai")
-    else:
-        return os.path.expanduser("~/.local/share/initai")
+    return APP_DATA_PATH
 
 
 def test_path_contains(path_to_check):
     """Check if PATH contains the given directory"""
-    current_path = os.environ.get("PATH", "")
-    if not current_path:
-        return False
+    return path_to_check.strip() in _PATH_SET
+
+
+def broadcast_environment_change():
+    """Notify running Windows programs that user environment variables changed"""
+    import ctypes
+    HWND_BROADCAST = 0xFFFF
+    WM_SETTINGCHANGE = 0x001A
+    SMTO_ABORTIFHUNG = 0x0002
 
-    path_entries = current_path.split(os.pathsep)
-    return any(entry.strip() == path_to_check.strip() for entry in path_entries)
+    result = ctypes.c_size_t()
+    ctypes.windll.user32.SendMessageTimeoutW(
+        HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment", SMTO_ABORTIFHUNG, 5000, ctypes.byref(result)
+    )
 
 
-def add_to_user_path(path_to_add, verbose=False):
-    """Add directory to user PATH"""
-    if test_path_contains(path_to_add):
-        write_verbose_message(f"PATH already contains: {path_to_add}", Colors.GREEN, verbose)
+def add_to_user_path(paths_to_add, verbose=False):
+    """Add directories to user PATH with a single read and write of the PATH setting"""
+    missing = []
+    for path_to_add in paths_to_add:
+        if test_path_contains(path_to_add) or path_to_add in missing:
+            write_verbose_message(f"PATH already contains: {path_to_add}", Colors.GREEN, verbose)
+        else:
+            missing.append(path_to_add)
+
+    if not missing:
         return True
 
     try:
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Windows: Update user environment variable
             import winreg
             key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_ALL_ACCESS)
             try:
-                current_path, _ = winreg.QueryValueEx(key, "PATH")
-            except FileNotFoundError:
-                current_path = ""
-
-            new_path = f"{current_path};{path_to_add}" if current_path else path_to_add
-            winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)
-            winreg.CloseKey(key)
+                try:
+                    current_path, _ = winreg.QueryValueEx(key, "PATH")
+                except FileNotFoundError:
+                    current_path = ""
+
+                existing = {entry.strip().lower() for entry in current_path.split(";")}
+                additions = [path for path in missing if path.strip().lower() not in existing]
+                if additions:
+                    new_path = ";".join([current_path] + additions if current_path else additions)
+                    winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)
+            finally:
+                winreg.CloseKey(key)
+
+            # Let new shells pick up the change without signing out
+            try:
+                broadcast_environment_change()
+            except Exception as e:
+                write_verbose_message(f"Could not broadcast environment change: {e}", Colors.GRAY, verbose)
         else:
             # Unix-like: Add to .bashrc or .zshrc
-            shell_rc = None
-            if os.environ.get("SHELL", "").endswith("zsh"):
-                shell_rc = os.path.expanduser("~/.zshrc")
-            else:
-                shell_rc = os.path.expanduser("~/.bashrc")
-
-            export_line = f'export PATH="$PATH:{path_to_add}"'
-
-            if os.path.exists(shell_rc):
-                with open(shell_rc, 'r') as f:
-                    content = f.read()
-                if export_line not in content:
-                    with open(shell_rc, 'a') as f:
-                        f.write(f"\n# Added by initai.dev\n{export_line}\n")
-            else:
-                with open(shell_rc, 'w') as f:
-                    f.write(f"# Added by initai.dev\n{export_line}\n")
-
-        Colors.print_colored(f"[OK] Added to PATH: {path_to_add}", Colors.GREEN)
+            export_lines = [f'export PATH="$PATH:{path}"' for path in missing]
+
+            # Check and append through one handle; 'a+' also creates a missing rc file
+            with open(SHELL_RC, 'a+') as f:
+                f.seek(0)
+                content = f.read()
+                export_lines = [line for line in export_lines if line not in content]
+                if export_lines:
+                    separator = "\n" if content else ""
+                    f.write(separator + "# Added by initai.dev\n" + "\n".join(export_lines) + "\n")
+
+        for path_to_add in missing:
+            _PATH_SET.add(path_to_add.strip())
+            Colors.print_colored(f"[OK] Added to PATH: {path_to_add}", Colors.GREEN)
         Colors.print_colored("  PATH changes will take effect in new terminal sessions", Colors.GRAY)
         return True
 
@@ -109,37 +406,46 @@ def add_to_user_path(path_to_add, verbose=False):
         return False
 
 
-def install_initai_script(base_url, app_data_path, verbose=False):
-    """Download and install the main initai script"""
-    try:
-        # Create app data directory if it doesn't exist
-        app_data_path.mkdir(parents=True, exist_ok=True)
-        Colors.print_colored(f"[OK] Created directory: {app_data_path}", Colors.GREEN)
+def install_initai_script(base_url, app_data_path, verbose=False, cache_dir=None, log=Colors.print_colored):
+    """Download and install the main initai script; network and file errors propagate
 
-        # Download main script
-        main_script_url = f"{base_url}/initai.py"
-        main_script_path = app_data_path / "initai.py"
+    Progress messages go through log(message, color).
+    """
+    # Create app data directory if it doesn't exist
+    app_data_path.mkdir(parents=True, exist_ok=True)
+    log(f"[OK] Created directory: {app_data_path}", Colors.GREEN)
 
-        Colors.print_colored("Downloading initai.dev script...", Colors.BLUE)
-        write_verbose_message(f"From: {main_script_url}", Colors.GRAY, verbose)
-        write_verbose_message(f"To: {main_script_path}", Colors.GRAY, verbose)
+    # Download main script
+    main_script_url = f"{base_url}/initai.py"
+    main_script_path = app_data_path / "initai.py"
 
-        urllib.request.urlretrieve(main_script_url, main_script_path)
+    log("Downloading initai.dev script...", Colors.BLUE)
+    if verbose:
+        log(f"From: {main_script_url}", Colors.GRAY)
+        log(f"To: {main_script_path}", Colors.GRAY)
 
-        # Make executable on Unix-like systems
-        if platform.system() != "Windows":
-            os.chmod(main_script_path, 0o755)
+    modified = download_file(main_script_url, main_script_path, cache_dir)
 
-        Colors.print_colored("[OK] Downloaded initai.dev script", Colors.GREEN)
-        return True
+    # Record the checksum so a damaged or half-written script is detected later
+    checksum_path = app_data_path / "initai.py.sha256"
+    with atomic_write(checksum_path) as f:
+        f.write(f"{file_sha256(main_script_path)}  initai.py\n".encode())
 
-    except Exception as e:
-        Colors.print_colored(f"ERROR: Failed to download initai.dev script: {e}", Colors.RED)
-        return False
+    # Make executable on Unix-like systems
+    if not IS_WINDOWS:
+        os.chmod(main_script_path, 0o755)
 
+    if modified:
+        log("[OK] Downloaded initai.dev script", Colors.GREEN)
+    else:
+        log("[OK] initai.dev script is up to date", Colors.GREEN)
+
+
+def prompt_add_to_path(app_data_path, before_update=None):
+    """Prompt user to add initai to PATH
 
-def prompt_add_to_path(app_data_path):
-    """Prompt user to add initai to PATH"""
+    before_update, if given, is called once the user agrees but before PATH is changed.
+    """
     if test_path_contains(str(app_data_path)):
         Colors.print_colored("[OK] initai.dev is already in your PATH", Colors.GREEN)
         return "already_in_path"
@@ -157,7 +463,9 @@ def prompt_add_to_path(app_data_path):
 
     response = input("Add to PATH? (Y/n): ").strip()
     if response == "" or response.lower() == "y":
-        if add_to_user_path(str(app_data_path)):
+        if before_update:
+            before_update()
+        if add_to_user_path([str(app_data_path)]):
             return "added_to_path"
         else:
             return "failed_to_add"
@@ -168,19 +476,122 @@ def prompt_add_to_path(app_data_path):
         return "skipped"
 
 
+def load_main_script(main_script_path):
+    """Import the installed initai.py as a module without starting a new interpreter"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("initai", str(main_script_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def launch_main_script(main_script_path, base_url, extra_args, verbose=False, in_process=False):
+    """Hand over to initai.py by replacing this process on POSIX or a child process on Windows
+
+    With in_process, initai.py is first tried in this interpreter, which saves
+    the start-up of a second one right after a fresh install.
+    """
+    argv = [str(main_script_path), "--base-url", base_url] + extra_args
+    if verbose:
+        argv.append("--verbose")
+
+    if in_process:
+        try:
+            initai = load_main_script(main_script_path)
+        except Exception as e:
+            write_verbose_message(f"Could not load initai.dev in-process ({e}), starting it separately", Colors.GRAY, verbose)
+        else:
+            sys.argv = argv
+            return initai.main()
+
+    try:
+        if IS_WINDOWS:
+            import subprocess
+            subprocess.run([sys.executable] + argv)
+        else:
+            sys.stdout.flush()
+            os.execv(sys.executable, [sys.executable] + argv)
+    except Exception as e:
+        Colors.print_colored(f"ERROR: Failed to run initai.dev: {e}", Colors.RED)
+        sys.exit(1)
+
+
 def test_initai_installed(app_data_path):
-    """Check if initai is already installed"""
+    """Check if initai is installed and matches the checksum recorded at install time"""
     main_script_path = app_data_path / "initai.py"
-    return main_script_path.exists()
+    checksum_path = app_data_path / "initai.py.sha256"
+    # One stat covers both existence and an empty leftover file
+    try:
+        script_stat = os.stat(main_script_path)
+    except FileNotFoundError:
+        return False
+    if script_stat.st_size == 0:
+        return False
+
+    try:
+        checksum_stat = os.stat(checksum_path)
+    except FileNotFoundError:
+        # Installed before checksums were recorded
+        return True
+    # The sidecar is written after the script, so an untouched script is never newer
+    if script_stat.st_mtime_ns <= checksum_stat.st_mtime_ns:
+        return True
 
+    try:
+        expected = checksum_path.read_text().split()[0]
+    except (OSError, IndexError):
+        return True
+    if file_sha256(main_script_path) == expected:
+        # Only the timestamp changed; bump the sidecar so later runs skip the hash
+        with contextlib.suppress(OSError):
+            os.utime(checksum_path)
+        return True
 
-def main():
+    Colors.print_colored(
+        f"[WARNING] {main_script_path} does not match the checksum recorded at install time; reinstalling",
+        Colors.YELLOW,
+    )
+    return False
+
+
+def build_parser():
+    """Build the argparse parser, only needed for --help and usage errors"""
+    import argparse
     parser = argparse.ArgumentParser(description="InitAI.dev Bootstrap Installer")
     parser.add_argument("--base-url", default="https://initai.dev", help="Custom base URL")
     parser.add_argument("--force", action="store_true", help="Force reinstallation")
     parser.add_argument("--verbose", action="store_true", help="Show verbose output")
+    parser.add_argument("--filesystem-cache", metavar="PATH", help="Cache downloads in this directory (e.g. a CI cache mount)")
+    return parser
+
+
+def parse_args(argv):
+    """Parse the installer's own options; anything else is passed on to initai.py"""
+    args = {"base_url": "https://initai.dev", "force": False, "verbose": False, "filesystem_cache": None}
+    remaining_args = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        name, has_value, value = arg.partition("=")
+        if arg in ("-h", "--help"):
+            build_parser().parse_args([arg])
+        elif arg in ("--force", "--verbose"):
+            args[arg[2:]] = True
+        elif name in VALUE_OPTIONS:
+            if not has_value:
+                i += 1
+                if i == len(argv):
+                    build_parser().error(f"argument {name}: expected one argument")
+                value = argv[i]
+            args[VALUE_OPTIONS[name]] = value
+        else:
+            remaining_args.append(arg)
+        i += 1
+    return types.SimpleNamespace(**args), remaining_args
+
 
-    args, remaining_args = parser.parse_known_args()
+def main():
+    args, remaining_args = parse_args(sys.argv[1:])
 
     write_header()
 
@@ -202,46 +613,67 @@ def main():
         print()
         Colors.print_colored("Running initai.dev...", Colors.BLUE)
 
-        # Execute the main script with any remaining arguments
+        return launch_main_script(main_script_path, args.base_url, remaining_args, args.verbose)
+
+    import http.client
+    import threading
+    import zlib
+
+    # Download failures reported as a clean error rather than a traceback; a truncated
+    # or corrupt gzip body raises EOFError or zlib.error
+    download_error_types = (OSError, ValueError, EOFError, zlib.error, http.client.HTTPException)
+
+    # Install the main script in the background while the PATH question is
+    # on screen; its messages are held back so they don't interleave with it
+    download_log = []
+    download_errors = []
+
+    def download():
         try:
-            cmd = [sys.executable, str(main_script_path), "--base-url", args.base_url] + remaining_args
-            subprocess.run(cmd)
+            install_initai_script(
+                args.base_url, app_data_path, args.verbose, args.filesystem_cache,
+                log=lambda message, color: download_log.append((message, color)),
+            )
         except Exception as e:
-            Colors.print_colored(f"ERROR: Failed to run initai.dev: {e}", Colors.RED)
+            download_errors.append(e)
+
+    def finish_download():
+        # Wait for the download and report it; a failure exits before PATH is touched
+        download_thread.join()
+        if download_log:
+            print()
+        while download_log:
+            Colors.print_colored(*download_log.pop(0))
+        for e in download_errors:
+            if not isinstance(e, download_error_types):
+                raise e
+            Colors.print_colored(f"ERROR: Failed to download initai.dev script: {e}", Colors.RED)
             sys.exit(1)
-        return
 
-    # Install the main script
-    if not install_initai_script(args.base_url, app_data_path, args.verbose):
-        sys.exit(1)
+    download_thread = threading.Thread(target=download, daemon=True)
+    download_thread.start()
 
-    # Prompt for PATH setup
-    path_result = prompt_add_to_path(app_data_path)
+    # Prompt for PATH setup; the shell rc file or registry is only changed once
+    # the download has succeeded
+    path_result = prompt_add_to_path(app_data_path, before_update=finish_download)
+    finish_download()
 
     print()
     Colors.print_colored("[OK] initai.dev installation complete!", Colors.GREEN)
 
-    if path_result == "already_in_path":
+    if path_result in ("already_in_path", "added_to_path"):
         Colors.print_colored("You can now run 'initai' from any directory", Colors.CYAN)
-    elif path_result == "added_to_path":
-        Colors.print_colored("You can now run 'initai' from any directory", Colors.CYAN)
-        Colors.print_colored("(Restart your terminal for PATH changes to take effect)", Colors.GRAY)
-    elif path_result == "skipped":
-        Colors.print_colored(f"To run initai.dev, use: python {main_script_path}", Colors.YELLOW)
-    elif path_result == "failed_to_add":
+        if path_result == "added_to_path":
+            Colors.print_colored("(Restart your terminal for PATH changes to take effect)", Colors.GRAY)
+    elif path_result in ("skipped", "failed_to_add"):
         Colors.print_colored(f"To run initai.dev, use: python {main_script_path}", Colors.YELLOW)
-        Colors.print_colored(f"PATH setup failed - you can add manually: {app_data_path}", Colors.GRAY)
+        if path_result == "failed_to_add":
+            Colors.print_colored(f"PATH setup failed - you can add manually: {app_data_path}", Colors.GRAY)
 
     print()
     Colors.print_colored("Starting initai.dev for initial setup...", Colors.BLUE)
 
-    # Run the main script for initial configuration
-    try:
-        cmd = [sys.executable, str(main_script_path), "--base-url", args.base_url]
-        subprocess.run(cmd)
-    except Exception as e:
-        Colors.print_colored(f"ERROR: Failed to run initial setup: {e}", Colors.RED)
-        sys.exit(1)
+    return launch_main_script(main_script_path, args.base_url, remaining_args, args.verbose, in_process=True)
 
 
 if __name__ == "__main__":